@@ -1,52 +1,88 @@
 import logging
+import os
 import socket
 import threading
 import time
-import traceback
 from abc import ABC, abstractmethod
-from typing import Any, Callable, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
 
-import requests
-import werkzeug
+import werkzeug.serving
 from dash import Dash, Input, Output
 from dash.development.base_component import Component
-from flask import Flask
 from plotly.graph_objs import Figure
 
+_QT_IMPORT_ERROR_MESSAGE = (
+    "Failed to import PySide6 Qt runtime dependencies. "
+    "Install Linux system libraries and try again: "
+    "`sudo apt-get update && COMMON_PACKAGES=\"libegl1 libgl1 "
+    "libxkbcommon-x11-0 libdbus-1-3 libnss3 libxcomposite1 "
+    "libxdamage1 libxrandr2\" && sudo apt-get install -y "
+    "--no-install-recommends $COMMON_PACKAGES libasound2t64 || "
+    "sudo apt-get install -y --no-install-recommends "
+    "$COMMON_PACKAGES libasound2`. "
+    "See README.md: Linux Runtime Dependencies."
+)
+
 try:
     from PySide6.QtCore import (
         QCoreApplication,
         QEvent,
-        QMetaObject,
         QMessageLogContext,
-        Qt,
+        QTimer,
         QtMsgType,
         QUrl,
         qInstallMessageHandler,
     )
     from PySide6.QtGui import QColor
-    from PySide6.QtWebEngineWidgets import QWebEngineView
     from PySide6.QtWidgets import QApplication, QMainWindow
 except ImportError as exc:
-    raise ImportError(
-        "Failed to import PySide6 Qt runtime dependencies. "
-        "Install Linux system libraries and try again: "
-        "`sudo apt-get update && COMMON_PACKAGES=\"libegl1 libgl1 "
-        "libxkbcommon-x11-0 libdbus-1-3 libnss3 libxcomposite1 "
-        "libxdamage1 libxrandr2\" && sudo apt-get install -y "
-        "--no-install-recommends $COMMON_PACKAGES libasound2t64 || "
-        "sudo apt-get install -y --no-install-recommends "
-        "$COMMON_PACKAGES libasound2`. "
-        "See README.md: Linux Runtime Dependencies."
-    ) from exc
+    raise ImportError(_QT_IMPORT_ERROR_MESSAGE) from exc
+
+# Qt invokes the installed message handler for every log message, which can be
+# hundreds per second while a page loads; a dict lookup keeps dispatch to a
+# single hashed get per message.
+_QT_LEVEL_MAP = {
+    QtMsgType.QtDebugMsg: logging.DEBUG,
+    QtMsgType.QtInfoMsg: logging.INFO,
+    QtMsgType.QtWarningMsg: logging.WARNING,
+    QtMsgType.QtCriticalMsg: logging.ERROR,
+    QtMsgType.QtFatalMsg: logging.CRITICAL,
+}
+
+
+class _PooledWSGIServer(werkzeug.serving.ThreadedWSGIServer):
+    """Threaded WSGI server that handles requests on a bounded worker pool.
+
+    werkzeug's ThreadedWSGIServer spawns and tears down an OS thread per
+    request. The embedded browser is the only client, so a small fixed pool
+    serves its asset and callback traffic with far less thread churn while
+    keeping werkzeug's HTTP/1.1 keep-alive behavior.
+    """
+
+    def __init__(self, *args: Any, max_workers: int = 8, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{type(self).__name__}Worker",
+        )
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._executor.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._executor.shutdown(wait=False)
 
 
 class EmbeddedDashApplicationListener(ABC):
     """Receives lifecycle events from an :class:`EmbeddedDashApplication`."""
 
+    __slots__ = ()
+
     @abstractmethod
     def on_dash_app_started(self, app: "EmbeddedDashApplication") -> None:
-        """Called after server and browser threads have started successfully."""
+        """Called after the server has started, before the browser event loop runs."""
 
     @abstractmethod
     def on_dash_app_stopped(self, app: "EmbeddedDashApplication", exit_code: int) -> None:
@@ -54,7 +90,34 @@ class EmbeddedDashApplicationListener(ABC):
 
 
 class EmbeddedDashApplication(ABC):
-    """Run a Dash app embedded in a Qt WebEngine window."""
+    """Run a Dash app embedded in a Qt WebEngine window.
+
+    Threading model: :meth:`run_forever` runs the Qt event loop on the
+    calling thread (required on macOS) while the WSGI server runs on a
+    single worker thread. The two sides coordinate through
+    :class:`threading.Event` signals, the server's thread-safe
+    ``shutdown()`` method, and a Qt timer that watches server liveness
+    from inside the event loop.
+    """
+
+    __slots__ = (
+        "_cls_name",
+        "_logger",
+        "_listener",
+        "_name",
+        "_server",
+        "_server_port",
+        "_server_thread",
+        "_wsgi_server",
+        "_server_error",
+        "_browser",
+        "_exit_code",
+        "_exit_code_lock",
+        "_server_ready",
+        "_server_stopped",
+        "_server_shutdown_requested",
+        "_browser_close_requested",
+    )
 
     def __init__(
         self,
@@ -62,64 +125,61 @@ class EmbeddedDashApplication(ABC):
         name: str | None = None,
     ) -> None:
         cls = type(self)
-        self._logger: logging.Logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+        self._cls_name = cls.__name__
+        self._logger: logging.Logger = logging.getLogger(f"{cls.__module__}.{self._cls_name}")
 
         self._listener = listener
         self._name = name
 
-        server = Flask(type(self).__name__)
-        self._server = Dash(type(self).__name__, server=server)
-
-        @server.route("/health")
-        def health_check() -> tuple[str, int]:
-            return "OK", 200
+        # Dash constructs its own Flask server; passing one in would just add
+        # a redundant Flask instance to merge into.
+        self._server = Dash(self._cls_name)
 
         self._server_port: int | None = None
         self._server_thread: threading.Thread | None = None
         self._wsgi_server: werkzeug.serving.BaseWSGIServer | None = None
+        self._server_error: Exception | None = None
 
         self._browser: EmbeddedDashApplication._EmbeddedBrowser | None = None
-        self._browser_thread: threading.Thread | None = None
 
         self._exit_code = 0
         self._exit_code_lock = threading.Lock()
 
+        self._server_ready = threading.Event()
+        self._server_stopped = threading.Event()
         self._server_shutdown_requested = threading.Event()
         self._browser_close_requested = threading.Event()
 
     def run_forever(self) -> None:
-        self._logger.info("Starting %s...", type(self).__name__)
+        self._logger.info("Starting %s...", self._cls_name)
         started_successfully = False
 
         try:
             if not self._start_server():
                 self._logger.error("The Dash server failed to start. Shutting down...")
                 self._set_exit_code(1)
-            elif not self._start_browser():
-                self._logger.error("The browser failed to start. Shutting down...")
-                self._shutdown_server_and_wait(timeout=5)
-                self._set_exit_code(1)
             else:
                 started_successfully = True
-                self._logger.info("The Dash server and browser started successfully")
+                self._logger.info("The Dash server started successfully")
                 self._notify_started()
-                self._monitor_threads_until_exit()
+                # The Qt event loop runs on this thread (its required home on
+                # macOS, and the least fragile arrangement elsewhere); the
+                # call blocks until the browser window closes.
+                self._set_exit_code(self._run_browser())
+                self._shutdown_server_and_wait(timeout=5)
 
-        except Exception as exc:
-            self._logger.error("Unexpected error while running Dash application: %s", exc)
-            self._logger.error(traceback.format_exc())
+        except Exception:
+            self._logger.exception("Unexpected error while running Dash application")
             self._set_exit_code(1)
             if started_successfully:
                 self._cleanup_on_error()
 
         finally:
             self._notify_stopped()
-            self._logger.info("%s finishing with exit code: %s", type(self).__name__, self.exit_code)
+            self._logger.info("%s finishing with exit code: %s", self._cls_name, self.exit_code)
 
             if self._server_thread and self._server_thread.is_alive():
                 self._logger.warning("Server thread is still alive during final cleanup")
-            if self._browser_thread and self._browser_thread.is_alive():
-                self._logger.warning("Browser thread is still alive during final cleanup")
 
     def request_browser_close(self) -> None:
         """Request a graceful close of the embedded browser window."""
@@ -142,166 +202,124 @@ class EmbeddedDashApplication(ABC):
         """Return either a single Dash component or a list of components."""
 
     @abstractmethod
-    def _build_callbacks(self) -> list[tuple[Output | list[Output], Input | list[Input], Callable[..., Figure]]]:
-        """Return `(outputs, inputs, callback_fn)` callback descriptors."""
+    def _build_callbacks(self) -> Iterable[tuple[Output | list[Output], Input | list[Input], Callable[..., Figure]]]:
+        """Return or yield `(outputs, inputs, callback_fn)` callback descriptors."""
+
+    def _build_clientside_callbacks(self) -> Iterable[tuple[str, Output | list[Output], Input | list[Input]]]:
+        """Return or yield `(source, outputs, inputs)` clientside callback descriptors.
+
+        Subclasses override this to register JavaScript callbacks that run in
+        the browser without a server round-trip; the default registers none.
+        """
+        return []
 
     def _start_server(self) -> bool:
         try:
             self._server.layout = self._build_layout()
+            register = self._server.callback
             for outputs, inputs, func in self._build_callbacks():
-                self._server.callback(outputs, inputs)(func)
-
-            self._server_port = self._find_available_port()
-            self._logger.debug("Starting Dash server on 127.0.0.1:%s", self._server_port)
-
+                register(outputs, inputs)(func)
+            register_clientside = self._server.clientside_callback
+            for source, outputs, inputs in self._build_clientside_callbacks():
+                register_clientside(source, outputs, inputs)
+
+            # A daemon thread cannot keep the process alive if serve_forever
+            # somehow never returns; orderly shutdown still waits on
+            # _server_stopped below.
             self._server_thread = threading.Thread(
                 target=self._run_server,
                 name=f"{Dash.__name__}Thread",
-                daemon=False,
+                daemon=True,
             )
             self._server_thread.start()
 
-            return self._wait_for_server_ready(max_wait_seconds=15.0, retry_interval_seconds=0.25)
+            return self._wait_for_server_ready(max_wait_seconds=15.0)
 
-        except Exception as exc:
-            self._logger.error("Failed to start Dash server: %s", exc)
-            self._logger.error(traceback.format_exc())
+        except Exception:
+            self._logger.exception("Failed to start Dash server")
             if self._server_thread and self._server_thread.is_alive():
                 self._request_server_shutdown_from_main()
             return False
 
-    def _wait_for_server_ready(self, max_wait_seconds: float, retry_interval_seconds: float) -> bool:
-        if self._server_port is None:
+    def _wait_for_server_ready(self, max_wait_seconds: float) -> bool:
+        if not self._server_ready.wait(timeout=max_wait_seconds):
+            self._logger.error(
+                "Dash server did not signal readiness within %.2f seconds",
+                max_wait_seconds,
+            )
+            self._shutdown_server_and_wait(timeout=5)
             return False
 
-        start_time = time.time()
-        while True:
-            if time.time() - start_time > max_wait_seconds:
-                self._logger.error(
-                    "Dash server health check timed out after %.2f seconds",
-                    max_wait_seconds,
-                )
-                self._shutdown_server_and_wait(timeout=5)
-                return False
+        if self._server_error is not None:
+            self._logger.error("Dash server failed during startup: %s", self._server_error)
+            return False
+
+        if self._wsgi_server is None or self._server_port is None:
+            self._logger.error("Dash server thread terminated unexpectedly during startup")
+            return False
 
-            if self._server_thread and not self._server_thread.is_alive():
-                self._logger.error("Dash server thread terminated unexpectedly during startup")
-                return False
+        # The listening socket is bound before the readiness event is set, so
+        # one cheap connect acts as a sanity check rather than a polling loop.
+        try:
+            with socket.create_connection(("127.0.0.1", self._server_port), timeout=1.0):
+                pass
+        except OSError as exc:
+            self._logger.error("Dash server readiness probe failed: %s", exc)
+            return False
 
-            try:
-                response = requests.get(
-                    f"http://127.0.0.1:{self._server_port}/health",
-                    timeout=1,
-                )
-                if response.status_code == 200:
-                    self._logger.debug("Dash server is ready")
-                    return True
-            except requests.exceptions.ConnectionError:
-                # Server is still warming up.
-                time.sleep(retry_interval_seconds)
-            except requests.exceptions.RequestException as exc:
-                self._logger.warning(
-                    "Health check request failed: %s; retrying in %.2f seconds",
-                    exc,
-                    retry_interval_seconds,
-                )
-                time.sleep(retry_interval_seconds)
+        self._logger.debug("Dash server is ready")
+        return True
 
     def _run_server(self) -> None:
         try:
-            if self._server_port is None:
-                raise RuntimeError("Server port was not initialized before server thread startup")
-
-            self._wsgi_server = werkzeug.serving.make_server(
+            # Port 0 lets the OS assign a free port during the server's own
+            # bind, so there is no separate probe socket and no window for
+            # another process to take the port.
+            self._wsgi_server = _PooledWSGIServer(
                 "127.0.0.1",
-                self._server_port,
+                0,
                 self._server.server,
-                threaded=True,
             )
+            self._server_port = int(self._wsgi_server.socket.getsockname()[1])
+            self._logger.debug("Dash server listening on 127.0.0.1:%s", self._server_port)
+            # The listening socket is bound at this point; signal the main
+            # thread before blocking in serve_forever.
+            self._server_ready.set()
             self._wsgi_server.serve_forever()
 
         except Exception as exc:
-            self._logger.error("Error while running Dash server: %s", exc)
-            self._logger.error(traceback.format_exc())
+            self._logger.exception("Error while running Dash server")
+            self._server_error = exc
             self._set_exit_code(1)
+            # Unblock a main thread waiting on readiness; it detects the
+            # failure through the recorded error / missing WSGI server.
+            self._server_ready.set()
 
         finally:
+            self._server_stopped.set()
             self._logger.debug("Dash server thread has terminated")
 
-    def _start_browser(self) -> bool:
-        try:
-            self._browser_thread = threading.Thread(
-                target=self._run_browser,
-                name=f"{EmbeddedDashApplication._EmbeddedBrowser.__name__}Thread",
-                daemon=False,
-            )
-            self._browser_thread.start()
-            return True
-
-        except Exception as exc:
-            self._logger.error("Failed to start browser thread: %s", exc)
-            self._logger.error(traceback.format_exc())
-            return False
-
-    def _run_browser(self) -> None:
-        try:
-            if self._server_port is None:
-                raise RuntimeError("Server port is unavailable for browser startup")
-
-            self._browser = EmbeddedDashApplication._EmbeddedBrowser(
-                url=f"http://127.0.0.1:{self._server_port}",
-                title=self._name,
-            )
-
-            if self._wsgi_server is None:
-                self._logger.error("Cannot set shutdown callback: WSGI server instance is not available")
-                self._set_exit_code(1)
-                return
-
-            self._browser.set_server_shutdown_callback(self._wsgi_server.shutdown)
-            browser_exit_code = self._browser.run_forever()
-            self._set_exit_code(browser_exit_code)
+    def _run_browser(self) -> int:
+        """Run the embedded browser on the calling thread until its window closes."""
+        if self._server_port is None:
+            raise RuntimeError("Server port is unavailable for browser startup")
 
-        except Exception as exc:
-            self._logger.error("Error while running browser thread: %s", exc)
-            self._logger.error(traceback.format_exc())
-            self._set_exit_code(1)
+        self._browser = EmbeddedDashApplication._EmbeddedBrowser(
+            url=f"http://127.0.0.1:{self._server_port}",
+            title=self._name,
+        )
 
-        finally:
-            self._logger.debug("Browser thread has terminated")
-
-    def _monitor_threads_until_exit(self) -> None:
-        self._logger.info("Dash application is running and monitoring threads")
-        server_stopped_first = False
-        browser_stopped_first = False
-
-        while True:
-            server_alive = bool(self._server_thread and self._server_thread.is_alive())
-            browser_alive = bool(self._browser_thread and self._browser_thread.is_alive())
-
-            if not server_alive and not browser_alive:
-                break
-
-            if not server_alive and browser_alive:
-                if not server_stopped_first:
-                    self._logger.warning(
-                        "Dash server terminated while browser is still running; requesting browser close",
-                    )
-                    server_stopped_first = True
-                self.request_browser_close()
-
-            if not browser_alive and server_alive:
-                if not browser_stopped_first:
-                    self._logger.warning(
-                        "Browser terminated while Dash server is still running; requesting server shutdown",
-                    )
-                    browser_stopped_first = True
-                self._request_server_shutdown_from_main()
-
-            time.sleep(0.1)
+        if self._wsgi_server is None:
+            self._logger.error("Cannot set shutdown callback: WSGI server instance is not available")
+            return 1
 
-        self._join_thread(self._server_thread, "server", timeout=5)
-        self._join_thread(self._browser_thread, "browser", timeout=5)
+        self._browser.set_server_shutdown_callback(self._wsgi_server.shutdown)
+        # The watchdog lets the browser close its window from the Qt event
+        # loop if the server thread dies underneath it.
+        self._browser.set_server_watchdog(
+            lambda: bool(self._server_thread and self._server_thread.is_alive())
+        )
+        return self._browser.run_forever()
 
     def _request_server_shutdown_from_main(self) -> bool:
         """Request WSGI server shutdown from a non-server thread."""
@@ -323,14 +341,21 @@ class EmbeddedDashApplication(ABC):
             return False
 
     def _shutdown_server_and_wait(self, timeout: float) -> None:
-        """Request server shutdown and keep retrying while waiting for thread exit."""
+        """Request server shutdown and wait for the server thread to exit."""
         if self._server_thread is None:
             return
 
         deadline = time.monotonic() + timeout
         while self._server_thread.is_alive() and time.monotonic() < deadline:
-            self._request_server_shutdown_from_main()
-            self._server_thread.join(timeout=0.1)
+            if self._request_server_shutdown_from_main():
+                # Shutdown was delivered; _run_server sets _server_stopped on
+                # the way out, so the wait returns the moment the server loop
+                # unwinds, and the short join lets the thread finish exiting.
+                self._server_stopped.wait(timeout=max(0.0, deadline - time.monotonic()))
+                self._server_thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            else:
+                # The WSGI server may not exist yet; retry shortly.
+                self._server_thread.join(timeout=0.1)
 
         if self._server_thread.is_alive():
             self._logger.warning("Server thread did not terminate after %.1f second(s)", timeout)
@@ -339,7 +364,7 @@ class EmbeddedDashApplication(ABC):
         """Best-effort cleanup for unexpected runtime failures."""
         self._logger.warning("Attempting cleanup after error in run_forever()")
 
-        if self._browser_thread and self._browser_thread.is_alive():
+        if self._browser is not None:
             self._logger.info("Requesting browser close due to error")
             self.request_browser_close()
 
@@ -347,7 +372,6 @@ class EmbeddedDashApplication(ABC):
             self._logger.info("Requesting server shutdown due to error")
             self._request_server_shutdown_from_main()
 
-        self._join_thread(self._browser_thread, "browser", timeout=5)
         self._join_thread(self._server_thread, "server", timeout=5)
 
     def _notify_started(self) -> None:
@@ -384,14 +408,29 @@ class EmbeddedDashApplication(ABC):
         if thread.is_alive():
             self._logger.warning("%s thread did not terminate after %.1f second(s)", label, timeout)
 
-    @staticmethod
-    def _find_available_port() -> int:
-        """Find an available localhost port."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.bind(("", 0))
-            return int(sock.getsockname()[1])
-
     class _EmbeddedBrowser:
+
+        # These classes have fixed names, so their loggers can be resolved
+        # once at class-definition time instead of per instance.
+        _logger = logging.getLogger(f"{__module__}.{__qualname__}")
+        _qt_logger = logging.getLogger("Qt")
+
+        __slots__ = (
+            "_qurl",
+            "_background_qcolor",
+            "_title",
+            "_x",
+            "_y",
+            "_width",
+            "_height",
+            "_server_shutdown_callback",
+            "_server_watchdog",
+            "_watchdog_timer",
+            "_original_qt_message_handler",
+            "_app",
+            "_main_window",
+        )
+
         def __init__(
             self,
             url: str,
@@ -402,27 +441,47 @@ class EmbeddedDashApplication(ABC):
             width: int = 800,
             height: int = 600,
         ) -> None:
-            self._url = url
-            self._background_color = background_color
+            # URL and color strings are immutable per instance, so parse them
+            # to their Qt value types once here instead of on the Qt thread
+            # every time a window is built.
+            self._qurl = QUrl(url)
+            self._background_qcolor = QColor(background_color)
             self._title = title if title else "Browser Window"
             self._x = x
             self._y = y
             self._width = width
             self._height = height
 
-            cls = type(self)
-            self._logger: logging.Logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
-            self._qt_logger = logging.getLogger("Qt")
-
             self._server_shutdown_callback: Callable[[], None] | None = None
-            self._original_qt_message_handler: Any = qInstallMessageHandler(self._qt_message_handler)
+            self._server_watchdog: Callable[[], bool] | None = None
+            self._watchdog_timer: QTimer | None = None
+
+            # Qt calls the installed handler for every message — a Python
+            # round-trip per line of QtWebEngine's page-load chatter. If the
+            # Qt logger cannot emit even a CRITICAL record, skip installing
+            # the handler so Qt's native one keeps running without Python.
+            self._original_qt_message_handler: Any = None
+            if self._qt_logger.isEnabledFor(logging.CRITICAL):
+                self._original_qt_message_handler = qInstallMessageHandler(self._qt_message_handler)
 
             self._app: QApplication | None = None
             self._main_window: QMainWindow | None = None
 
+        # Chromium defaults to software rasterization in embedded setups;
+        # these flags enable GPU compositing for chart-heavy pages. Applied
+        # with setdefault so callers can override via the environment.
+        _CHROMIUM_FLAGS = (
+            "--enable-gpu-rasterization "
+            "--ignore-gpu-blocklist "
+            "--enable-accelerated-2d-canvas "
+            "--enable-zero-copy"
+        )
+
         def run_forever(self) -> int:
             exit_code = 1
             try:
+                if QApplication.instance() is None:
+                    os.environ.setdefault("QTWEBENGINE_CHROMIUM_FLAGS", self._CHROMIUM_FLAGS)
                 existing_app = QApplication.instance()
                 if existing_app is None:
                     app = QApplication([])
@@ -433,12 +492,12 @@ class EmbeddedDashApplication(ABC):
                     return exit_code
                 self._app = app
                 self._build_main_window()
+                self._start_server_watchdog()
                 # Blocks until the Qt event loop exits.
                 exit_code = app.exec()
                 self._logger.debug("Browser event loop terminated with exit code: %s", exit_code)
-            except Exception as exc:
-                self._logger.error("Error in browser event loop: %s", exc)
-                self._logger.error(traceback.format_exc())
+            except Exception:
+                self._logger.exception("Error in browser event loop")
             finally:
                 if self._original_qt_message_handler:
                     qInstallMessageHandler(self._original_qt_message_handler)
@@ -449,6 +508,34 @@ class EmbeddedDashApplication(ABC):
             """Set callback used to shut down the WSGI server from Qt close events."""
             self._server_shutdown_callback = callback
 
+        def set_server_watchdog(self, is_server_alive: Callable[[], bool]) -> None:
+            """Set the liveness check polled from the Qt event loop.
+
+            When the check reports the server has died, the browser closes its
+            main window so the application can finish shutting down.
+            """
+            self._server_watchdog = is_server_alive
+
+        def _start_server_watchdog(self) -> None:
+            if self._server_watchdog is None:
+                return
+
+            timer = QTimer(self._app)
+            timer.setInterval(500)
+            timer.timeout.connect(self._check_server_alive)
+            timer.start()
+            self._watchdog_timer = timer
+
+        def _check_server_alive(self) -> None:
+            if self._server_watchdog is None or self._server_watchdog():
+                return
+
+            self._logger.warning("Dash server terminated while browser is running; closing window")
+            if self._watchdog_timer is not None:
+                self._watchdog_timer.stop()
+            if self._main_window is not None:
+                self._main_window.close()
+
         def close_main_window(self) -> None:
             """Queue a window close request from a non-GUI thread."""
             self._logger.info("Received request to close browser window")
@@ -456,46 +543,31 @@ class EmbeddedDashApplication(ABC):
                 self._logger.warning("Cannot request close: browser app or main window is not available")
                 return
 
-            # QueuedConnection schedules the close call in the Qt GUI event loop.
-            connection_type: Any = (
-                Qt.ConnectionType.QueuedConnection
-                if hasattr(Qt, "ConnectionType")
-                else getattr(Qt, "QueuedConnection")
+            # postEvent is documented thread-safe and delivers the close on
+            # the GUI thread, with none of QMetaObject.invokeMethod's
+            # per-call meta-object name lookup.
+            close_event_type: Any = (
+                QEvent.Type.Close if hasattr(QEvent, "Type") else getattr(QEvent, "Close")
             )
-            try:
-                # PySide6 runtime expects str here on some builds, while stubs
-                # still type this parameter as bytes-like.
-                method_name = cast(Any, "close")
-                request_successful = QMetaObject.invokeMethod(
-                    self._main_window,
-                    method_name,
-                    connection_type,
-                )
-            except Exception:
-                self._logger.warning("Failed to queue browser close request; posting close event", exc_info=True)
-                close_event_type: Any = (
-                    QEvent.Type.Close if hasattr(QEvent, "Type") else getattr(QEvent, "Close")
-                )
-                QCoreApplication.postEvent(self._main_window, QEvent(close_event_type))
-                return
-
-            if not request_successful:
-                self._logger.warning("Failed to queue browser close request; posting close event")
-                close_event_type = (
-                    QEvent.Type.Close if hasattr(QEvent, "Type") else getattr(QEvent, "Close")
-                )
-                QCoreApplication.postEvent(self._main_window, QEvent(close_event_type))
-            else:
-                self._logger.debug("Queued browser close request")
+            QCoreApplication.postEvent(self._main_window, QEvent(close_event_type))
+            self._logger.debug("Posted close event to browser window")
 
         def _build_main_window(self) -> None:
+            try:
+                # QtWebEngineWidgets drags in the Chromium runtime, by far the
+                # heaviest part of the Qt stack; importing it lazily keeps
+                # `import dashqt` cheap for code that never opens a window.
+                from PySide6.QtWebEngineWidgets import QWebEngineView
+            except ImportError as exc:
+                raise ImportError(_QT_IMPORT_ERROR_MESSAGE) from exc
+
             self._main_window = self._BrowserMainWindow(self)
             self._main_window.setWindowTitle(self._title)
             self._main_window.setGeometry(self._x, self._y, self._width, self._height)
 
             view = QWebEngineView()
-            view.page().setBackgroundColor(QColor(self._background_color))
-            view.setUrl(QUrl(self._url))
+            view.page().setBackgroundColor(self._background_qcolor)
+            view.setUrl(self._qurl)
 
             self._main_window.setCentralWidget(view)
             self._main_window.show()
@@ -507,25 +579,16 @@ class EmbeddedDashApplication(ABC):
             message: str,
         ) -> None:
             """Route Qt log messages into Python logging."""
-            match message_type:
-                case QtMsgType.QtDebugMsg:
-                    level = logging.DEBUG
-                case QtMsgType.QtInfoMsg:
-                    level = logging.INFO
-                case QtMsgType.QtWarningMsg:
-                    level = logging.WARNING
-                case QtMsgType.QtCriticalMsg:
-                    level = logging.ERROR
-                case QtMsgType.QtFatalMsg:
-                    level = logging.CRITICAL
-                case _:
-                    level = logging.WARNING
-
-            self._qt_logger.log(level, message)
+            level = _QT_LEVEL_MAP.get(message_type, logging.WARNING)
+            logger = self._qt_logger
+            if logger.isEnabledFor(level):
+                logger.log(level, message)
 
         class _BrowserMainWindow(QMainWindow):
             """Main window wrapper that requests server shutdown on close."""
 
+            _logger = logging.getLogger(f"{__module__}.{__qualname__}")
+
             def __init__(
                 self,
                 browser: "EmbeddedDashApplication._EmbeddedBrowser",
@@ -534,8 +597,6 @@ class EmbeddedDashApplication(ABC):
             ) -> None:
                 super().__init__(*args, **kwargs)
 
-                cls = type(self)
-                self._logger: logging.Logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
                 self._browser = browser
 
             def closeEvent(self, event: QEvent) -> None:  # noqa: N802
@@ -46,12 +46,27 @@ def _set_event_and_return_true(event: threading.Event) -> bool:
     return True
 
 
+def test_start_server_signals_readiness_and_shuts_down() -> None:
+    app = _DummyApp(name="DummyApp")
+
+    try:
+        assert app._start_server() is True
+        assert app._server_ready.is_set()
+        assert app._server_port is not None
+    finally:
+        app._shutdown_server_and_wait(timeout=5)
+
+    assert app._server_thread is not None
+    assert not app._server_thread.is_alive()
+    assert app.exit_code == 0
+
+
 def test_successful_start_and_stop_notifies_listener(monkeypatch: pytest.MonkeyPatch) -> None:
     listener = _RecordingListener()
     app = _DummyApp(listener=listener, name="DummyApp")
 
     monkeypatch.setattr(app, "_start_server", lambda: _start_sleeping_thread(app, "_server_thread", 0.1))
-    monkeypatch.setattr(app, "_start_browser", lambda: _start_sleeping_thread(app, "_browser_thread", 0.1))
+    monkeypatch.setattr(app, "_run_browser", lambda: 0)
 
     app.run_forever()
 
@@ -73,17 +88,25 @@ def test_server_start_failure_sets_nonzero_exit_code() -> None:
     assert listener.stopped_exit_codes == [1]
 
 
-def test_browser_start_failure_requests_server_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_browser_error_requests_server_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
     listener = _RecordingListener()
     app = _DummyApp(listener=listener, name="DummyApp")
     stop_server = threading.Event()
 
     def start_server() -> bool:
-        app._server_thread = _start_thread(lambda: stop_server.wait(timeout=5))
+        def serve() -> None:
+            # Mirror _run_server, which signals _server_stopped on exit.
+            stop_server.wait(timeout=5)
+            app._server_stopped.set()
+
+        app._server_thread = _start_thread(serve)
         return True
 
+    def run_browser() -> int:
+        raise RuntimeError("browser failed")
+
     monkeypatch.setattr(app, "_start_server", start_server)
-    monkeypatch.setattr(app, "_start_browser", lambda: False)
+    monkeypatch.setattr(app, "_run_browser", run_browser)
     monkeypatch.setattr(
         app,
         "_request_server_shutdown_from_main",
@@ -94,7 +117,7 @@ def test_browser_start_failure_requests_server_shutdown(monkeypatch: pytest.Monk
 
     assert app.exit_code == 1
     assert stop_server.is_set()
-    assert listener.started_calls == 0
+    assert listener.started_calls == 1
     assert listener.stopped_exit_codes == [1]
 
 
@@ -104,15 +127,16 @@ def test_browser_exit_while_server_running_triggers_server_shutdown(monkeypatch:
     stop_server = threading.Event()
 
     def start_server() -> bool:
-        app._server_thread = _start_thread(lambda: stop_server.wait(timeout=5))
-        return True
+        def serve() -> None:
+            # Mirror _run_server, which signals _server_stopped on exit.
+            stop_server.wait(timeout=5)
+            app._server_stopped.set()
 
-    def start_browser() -> bool:
-        app._browser_thread = _start_thread(lambda: app._set_exit_code(2))
+        app._server_thread = _start_thread(serve)
         return True
 
     monkeypatch.setattr(app, "_start_server", start_server)
-    monkeypatch.setattr(app, "_start_browser", start_browser)
+    monkeypatch.setattr(app, "_run_browser", lambda: 2)
     monkeypatch.setattr(
         app,
         "_request_server_shutdown_from_main",
@@ -127,30 +151,38 @@ def test_browser_exit_while_server_running_triggers_server_shutdown(monkeypatch:
     assert listener.stopped_exit_codes == [2]
 
 
-def test_server_exit_while_browser_running_triggers_browser_close(monkeypatch: pytest.MonkeyPatch) -> None:
-    listener = _RecordingListener()
-    app = _DummyApp(listener=listener, name="DummyApp")
-    close_browser = threading.Event()
+def test_run_browser_wires_shutdown_callback_and_watchdog(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = _DummyApp(name="DummyApp")
 
-    def start_server() -> bool:
-        app._server_thread = _start_thread(lambda: app._set_exit_code(3))
-        return True
+    class _RecordingBrowser:
+        def __init__(self, url: str, title: str | None = None) -> None:
+            self.url = url
+            self.title = title
+            self.shutdown_callback = None
+            self.watchdog = None
 
-    def start_browser() -> bool:
-        app._browser_thread = _start_thread(lambda: close_browser.wait(timeout=5))
-        return True
+        def set_server_shutdown_callback(self, callback) -> None:
+            self.shutdown_callback = callback
 
-    monkeypatch.setattr(app, "_start_server", start_server)
-    monkeypatch.setattr(app, "_start_browser", start_browser)
-    monkeypatch.setattr(
-        app,
-        "request_browser_close",
-        lambda: _set_event_and_return_true(close_browser),
-    )
+        def set_server_watchdog(self, is_server_alive) -> None:
+            self.watchdog = is_server_alive
 
-    app.run_forever()
+        def run_forever(self) -> int:
+            return 0
 
-    assert app.exit_code == 3
-    assert close_browser.is_set()
-    assert listener.started_calls == 1
-    assert listener.stopped_exit_codes == [3]
+    class _StubWSGIServer:
+        def shutdown(self) -> None:
+            pass
+
+    app._server_port = 12345
+    app._wsgi_server = _StubWSGIServer()  # type: ignore[assignment]
+    monkeypatch.setattr(EmbeddedDashApplication, "_EmbeddedBrowser", _RecordingBrowser)
+
+    assert app._run_browser() == 0
+
+    browser = app._browser
+    assert isinstance(browser, _RecordingBrowser)
+    assert browser.url == "http://127.0.0.1:12345"
+    assert browser.shutdown_callback is not None
+    assert browser.watchdog is not None
+    assert browser.watchdog() is False  # no server thread is running